@@ -1,25 +1,29 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable
-from contextlib import AbstractAsyncContextManager
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Sequence
+from contextlib import asynccontextmanager
 from enum import StrEnum
+from functools import partial
 from inspect import iscoroutinefunction
 from string.templatelib import Template
 from types import TracebackType
-from typing import Any, Protocol, TypeVar, override
+from typing import Any, Protocol, TypeGuard, TypeVar
 
 from asyncpg.connection import Connection as AsyncpgConnection
 from asyncpg.pool import PoolConnectionProxy
 from asyncpg.transaction import Transaction as AsyncpgTransaction
 
-from fassung.cursor import CursorFactory
+from fassung.cursor import DEFAULT_CURSOR_PREFETCH, CursorFactory
 from fassung.exceptions import TransactionClosedError
 from fassung.query_assembler import QueryAssembler
-from fassung.type_parser import TypeParser
+from fassung.type_parser import PASSTHROUGH_TYPES, TypeParser
 from fassung.types import Listener
 
 T = TypeVar("T")
 
+_parse = TypeParser.parse
+_parse_list = TypeParser.parse_list
+
 
 class _InnerListener(Protocol):
     def __call__(
@@ -32,6 +36,66 @@ class _InnerListener(Protocol):
     ) -> Awaitable[None] | None: ...
 
 
+def _is_async[T](callback: Listener[T]) -> TypeGuard[Callable[[Connection, int, str, T], Awaitable[None]]]:
+    # inspect only recognises coroutine functions (including wrapped partials and methods), so also
+    # check __call__ on the type to support listener objects with an async __call__
+    return iscoroutinefunction(callback) or iscoroutinefunction(type(callback).__call__)
+
+
+class _ListenerAdapter[T, R]:
+    """Parses notification payloads and forwards them to a [fassung.types.Listener][].
+
+    The payload type and callback are resolved once at registration, so dispatching a
+    notification does not need to inspect the callback again. The callback receives the
+    [fassung.connection.Connection][] that registered it; a new wrapper is only built if asyncpg
+    reports a different connection.
+    """
+
+    __slots__ = ("_callback", "_con_ref", "_connection", "_parse", "_payload_type", "_query_assembler")
+
+    def __init__(
+        self,
+        payload_type: type[T],
+        callback: Callable[[Connection, int, str, T], R],
+        connection: Connection,
+        con_ref: AsyncpgConnection | PoolConnectionProxy,
+        query_assembler: QueryAssembler,
+    ) -> None:
+        self._payload_type: type[T] = payload_type
+        self._callback: Callable[[Connection, int, str, T], R] = callback
+        self._query_assembler: QueryAssembler = query_assembler
+        self._parse: Callable[[type[T], object], T] = TypeParser.parse
+        self._con_ref: AsyncpgConnection | PoolConnectionProxy = con_ref
+        self._connection: Connection = connection
+
+    def _wrap(self, con_ref: AsyncpgConnection | PoolConnectionProxy) -> Connection:
+        connection = self._connection
+        if self._con_ref is not con_ref:
+            connection = self._connection = Connection(con_ref, self._query_assembler)
+            self._con_ref = con_ref
+        return connection
+
+
+class _AsyncListenerAdapter[T](_ListenerAdapter[T, Awaitable[None]]):
+    __slots__ = ()
+
+    async def __call__(
+        self, con_ref: AsyncpgConnection | PoolConnectionProxy, pid: int, channel: str, payload: object, /
+    ) -> None:
+        parsed_payload = self._parse(self._payload_type, payload)
+        await self._callback(self._wrap(con_ref), pid, channel, parsed_payload)
+
+
+class _SyncListenerAdapter[T](_ListenerAdapter[T, Awaitable[None] | None]):
+    __slots__ = ()
+
+    def __call__(
+        self, con_ref: AsyncpgConnection | PoolConnectionProxy, pid: int, channel: str, payload: object, /
+    ) -> None:
+        parsed_payload = self._parse(self._payload_type, payload)
+        _ = self._callback(self._wrap(con_ref), pid, channel, parsed_payload)
+
+
 class TransactionStatus(StrEnum):
     """Lifecycle states of a transaction."""
 
@@ -49,10 +113,13 @@ class Transaction:
     Use a [fassung.connection.Connection][] as an async context manager to obtain one.
     """
 
+    __slots__ = ("_connection", "_is_active", "_transaction", "status")
+
     def __init__(self, connection: Connection, transaction: AsyncpgTransaction) -> None:
         self._connection: Connection = connection
         self._transaction: AsyncpgTransaction = transaction
         self.status: TransactionStatus = TransactionStatus.STARTED
+        self._is_active: bool = True  # mirrors status == STARTED for the guard inlined in each query method
 
     async def execute(self, query: Template) -> str:
         """Execute a SQL command and return its status string.
@@ -60,22 +127,45 @@ class Transaction:
         Args:
             query: A t-string template containing the SQL to execute.
         """
-        self._check_status()
+        if not self._is_active:
+            raise self._closed_error()
         return await self._connection.execute(query)
 
+    async def executemany(self, queries: Iterable[Template], *, timeout: float | None = None) -> None:
+        """Execute a SQL command once per template in a single pipelined batch.
+
+        Args:
+            queries: t-string templates that all assemble to the same SQL, e.g. one literal
+                evaluated for different values.
+            timeout: Optional query timeout in seconds.
+
+        Raises:
+            ValueError: If the templates do not all assemble to the same SQL.
+        """
+        if not self._is_active:
+            raise self._closed_error()
+        await self._connection.executemany(queries, timeout=timeout)
+
     def cursor(
-        self, type_: type[T], query: Template, *, prefetch: int | None = None, timeout: float | None = None
+        self,
+        type_: type[T],
+        query: Template,
+        *,
+        prefetch: int | None = DEFAULT_CURSOR_PREFETCH,
+        timeout: float | None = None,
     ) -> CursorFactory[T]:
         """Create a cursor factory for iterating over query results.
 
         Args:
             type_: The row type to parse each result into.
             query: A t-string template containing the SQL query.
-            prefetch: Number of rows to prefetch.
+            prefetch: Number of rows fetched and parsed per page when iterating. Higher values
+                save round trips on large results but keep more rows in memory. ``None`` uses the default.
             timeout: Optional query timeout in seconds.
         """
-        self._check_status()
-        return self._connection.cursor(type_=type_, query=query, prefetch=prefetch, timeout=timeout)
+        if not self._is_active:
+            raise self._closed_error()
+        return self._connection.cursor(type_, query, prefetch=prefetch, timeout=timeout)
 
     async def fetch(self, type_: type[T], query: Template, *, timeout: float | None = None) -> list[T]:
         """Execute a query and return all resulting rows as a typed list.
@@ -85,8 +175,9 @@ class Transaction:
             query: A t-string template containing the SQL query.
             timeout: Optional query timeout in seconds.
         """
-        self._check_status()
-        return await self._connection.fetch(type_=type_, query=query, timeout=timeout)
+        if not self._is_active:
+            raise self._closed_error()
+        return await self._connection.fetch(type_, query, timeout=timeout)
 
     async def fetchval(self, type_: type[T], query: Template, column: int = 0, *, timeout: float | None = None) -> T:
         """Execute a query and return a single scalar value.
@@ -97,8 +188,9 @@ class Transaction:
             column: Zero-based column index to extract.
             timeout: Optional query timeout in seconds.
         """
-        self._check_status()
-        return await self._connection.fetchval(type_=type_, query=query, column=column, timeout=timeout)
+        if not self._is_active:
+            raise self._closed_error()
+        return await self._connection.fetchval(type_, query, column, timeout=timeout)
 
     async def fetchrow(self, type_: type[T], query: Template, *, timeout: float | None = None) -> T | None:
         """Execute a query and return the first row, or ``None`` if empty.
@@ -108,18 +200,62 @@ class Transaction:
             query: A t-string template containing the SQL query.
             timeout: Optional query timeout in seconds.
         """
-        self._check_status()
-        return await self._connection.fetchrow(type_=type_, query=query, timeout=timeout)
+        if not self._is_active:
+            raise self._closed_error()
+        return await self._connection.fetchrow(type_, query, timeout=timeout)
+
+    async def copy_records_to_table(
+        self,
+        table_name: str,
+        *,
+        records: Iterable[Sequence[object]],
+        columns: Sequence[str] | None = None,
+        schema_name: str | None = None,
+        timeout: float | None = None,
+    ) -> str:
+        """Bulk-load *records* into a table with ``COPY`` and return its status string.
+
+        Args:
+            table_name: The name of the table to copy into.
+            records: The rows to copy, each a sequence of column values.
+            columns: The columns the values belong to. Defaults to all columns in table order.
+            schema_name: The schema of the table. Defaults to the search path.
+            timeout: Optional query timeout in seconds.
+        """
+        if not self._is_active:
+            raise self._closed_error()
+        return await self._connection.copy_records_to_table(
+            table_name, records=records, columns=columns, schema_name=schema_name, timeout=timeout
+        )
 
     async def rollback(self) -> None:
         """Roll back the transaction."""
         await self._transaction.rollback()
         self.status = TransactionStatus.ROLLED_BACK
+        self._is_active = False
 
     async def commit(self) -> None:
         """Commit the transaction."""
         await self._transaction.commit()
         self.status = TransactionStatus.COMMITTED
+        self._is_active = False
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncGenerator[Transaction]:
+        """Open a savepoint within this transaction, reusing its connection.
+
+        The yielded [fassung.connection.Transaction][] is released when the block exits and
+        rolled back to if the block raises or marks it for rollback, without ending this
+        transaction:
+
+            async with connection as txn, txn.savepoint() as sp:
+                await sp.execute(t"...")
+                sp.mark_for_rollback()
+        """
+        if not self._is_active:
+            raise self._closed_error()
+        async with self._connection as savepoint:
+            yield savepoint
 
     def mark_for_rollback(self) -> None:
         """Mark the transaction for rollback.
@@ -128,13 +264,13 @@ class Transaction:
         is performed when the [fassung.connection.Connection][] context manager exits.
         """
         self.status = TransactionStatus.MARKED_FOR_ROLLBACK
+        self._is_active = False
 
-    def _check_status(self) -> None:
-        if self.status != TransactionStatus.STARTED:
-            raise TransactionClosedError(f"Transaction is not in started status: {self.status}")
+    def _closed_error(self) -> TransactionClosedError:
+        return TransactionClosedError(f"Transaction is not in started status: {self.status}")
 
 
-class Connection(AbstractAsyncContextManager[Transaction]):
+class Connection:
     """Async database connection that assembles t-string queries and parses results.
 
     Use as an async context manager to start a [fassung.connection.Transaction][]:
@@ -143,13 +279,31 @@ class Connection(AbstractAsyncContextManager[Transaction]):
             await txn.execute(t"...")
     """
 
+    __slots__ = (
+        "_assemble",
+        "_connection",
+        "_execute",
+        "_fetch",
+        "_fetchrow",
+        "_fetchval",
+        "_listener_mapping",
+        "_query_assembler",
+        "_transactions",
+    )
+
     def __init__(self, connection: AsyncpgConnection | PoolConnectionProxy, query_assembler: QueryAssembler) -> None:
         self._connection: AsyncpgConnection | PoolConnectionProxy = connection
         self._query_assembler: QueryAssembler = query_assembler
-        self._transaction: Transaction | None = None
+        self._transactions: list[Transaction] = []  # one per open ``async with`` block, innermost last
         self._listener_mapping: dict[
             tuple[Listener[Any], str], _InnerListener
         ] = {}  # used for mapping our listener functions to asyncpg's listener functions
+        # bound once here to save the attribute lookups on every query
+        self._assemble = query_assembler.assemble
+        self._execute = connection.execute
+        self._fetch = connection.fetch
+        self._fetchval = connection.fetchval
+        self._fetchrow = connection.fetchrow
 
     async def execute(self, query: Template, *, timeout: float | None = None) -> str:
         """Execute a SQL command and return its status string.
@@ -158,26 +312,60 @@ class Connection(AbstractAsyncContextManager[Transaction]):
             query: A t-string template containing the SQL to execute.
             timeout: Optional query timeout in seconds.
         """
-        assembled = self._query_assembler.assemble(query)
-        return await self._connection.execute(assembled.query, *assembled.args, timeout=timeout)
+        assembled = self._assemble(query)
+        return await self._execute(assembled.query, *assembled.args, timeout=timeout)
+
+    async def executemany(self, queries: Iterable[Template], *, timeout: float | None = None) -> None:
+        """Execute a SQL command once per template in a single pipelined batch.
+
+        Each template only contributes its arguments; the statement is prepared once and asyncpg
+        sends all argument sets before waiting for the server, so N executions cost about one
+        round trip instead of N.
+
+        Args:
+            queries: t-string templates that all assemble to the same SQL, e.g. one literal
+                evaluated for different values.
+            timeout: Optional query timeout in seconds.
+
+        Raises:
+            ValueError: If the templates do not all assemble to the same SQL.
+        """
+        assemble = self._assemble
+        sql: str | None = None
+        args: list[tuple[Any, ...]] = []
+        for query in queries:
+            assembled = assemble(query)
+            if sql is None:
+                sql = assembled.query
+            elif assembled.query != sql:
+                raise ValueError(f"executemany requires the same SQL for every query, got {assembled.query!r}")
+            args.append(assembled.args)
+        if sql is None:
+            return
+        await self._connection.executemany(sql, args, timeout=timeout)
 
     def cursor(
-        self, type_: type[T], query: Template, *, prefetch: int | None = None, timeout: float | None = None
+        self,
+        type_: type[T],
+        query: Template,
+        *,
+        prefetch: int | None = DEFAULT_CURSOR_PREFETCH,
+        timeout: float | None = None,
     ) -> CursorFactory[T]:
         """Create a cursor factory for iterating over query results.
 
         Args:
             type_: The row type to parse each result into.
             query: A t-string template containing the SQL query.
-            prefetch: Number of rows to prefetch.
+            prefetch: Number of rows fetched and parsed per page when iterating. Higher values
+                save round trips on large results but keep more rows in memory. ``None`` uses the default.
             timeout: Optional query timeout in seconds.
         """
-        assembled = self._query_assembler.assemble(query)
+        assembled = self._assemble(query)
         return CursorFactory(
-            cursor_factory=self._connection.cursor(
-                assembled.query, *assembled.args, prefetch=prefetch, timeout=timeout
-            ),
+            open_cursor=partial(self._connection.cursor, assembled.query, *assembled.args, timeout=timeout),
             type_=type_,
+            prefetch=prefetch,
         )
 
     async def fetch(self, type_: type[T], query: Template, *, timeout: float | None = None) -> list[T]:
@@ -188,9 +376,50 @@ class Connection(AbstractAsyncContextManager[Transaction]):
             query: A t-string template containing the SQL query.
             timeout: Optional query timeout in seconds.
         """
-        assembled = self._query_assembler.assemble(query)
-        raw_list = await self._connection.fetch(assembled.query, *assembled.args, timeout=timeout)
-        return TypeParser.parse(list[type_], raw_list)
+        assembled = self._assemble(query)
+        raw_list = await self._fetch(assembled.query, *assembled.args, timeout=timeout)
+        return _parse_list(type_, raw_list)
+
+    def specialize(self, type_: type[T], query: Template) -> Callable[..., Awaitable[list[T]]]:
+        """Build a fetch function for a query that is run many times with different values.
+
+        The template is assembled and the row type resolved once. The returned coroutine function takes
+        the values for the query's placeholders positionally, in template order, plus an optional
+        ``timeout`` keyword, and returns the rows like [fassung.connection.Connection.fetch][].
+        It raises ``TypeError`` if it is not given exactly one value per placeholder.
+
+        The values interpolated into *query* are never sent to the database; they only mark where
+        the placeholders go, so ``t"... WHERE id = {0}"`` works as well as a real id.
+
+        Args:
+            type_: The row type to parse each result into.
+            query: A t-string template containing the SQL query.
+        """
+        sql, placeholders = self._assemble(query)
+        expected = len(placeholders)
+        fetch = self._fetch
+
+        def mismatch(given: int) -> TypeError:
+            return TypeError(f"specialized query has {expected} placeholders but got {given} values")
+
+        if type_ in PASSTHROUGH_TYPES:
+
+            async def fetch_raw(*args: object, timeout: float | None = None) -> list[T]:
+                if len(args) != expected:
+                    raise mismatch(len(args))
+                return await fetch(sql, *args, timeout=timeout)  # pyright: ignore[reportReturnType]
+
+            return fetch_raw
+
+        list_adapter = TypeParser.list_adapter(type_)
+        validate_list = TypeParser.validate_list
+
+        async def fetch_parsed(*args: object, timeout: float | None = None) -> list[T]:
+            if len(args) != expected:
+                raise mismatch(len(args))
+            return validate_list(list_adapter, await fetch(sql, *args, timeout=timeout))
+
+        return fetch_parsed
 
     async def fetchval(self, type_: type[T], query: Template, column: int = 0, *, timeout: float | None = None) -> T:
         """Execute a query and return a single scalar value.
@@ -201,9 +430,9 @@ class Connection(AbstractAsyncContextManager[Transaction]):
             column: Zero-based column index to extract.
             timeout: Optional query timeout in seconds.
         """
-        assembled = self._query_assembler.assemble(query)
-        raw_value = await self._connection.fetchval(assembled.query, *assembled.args, column=column, timeout=timeout)
-        return TypeParser.parse(type_, raw_value)
+        assembled = self._assemble(query)
+        raw_value = await self._fetchval(assembled.query, *assembled.args, column=column, timeout=timeout)
+        return _parse(type_, raw_value)
 
     async def fetchrow(self, type_: type[T], query: Template, *, timeout: float | None = None) -> T | None:
         """Execute a query and return the first row, or ``None`` if empty.
@@ -213,11 +442,36 @@ class Connection(AbstractAsyncContextManager[Transaction]):
             query: A t-string template containing the SQL query.
             timeout: Optional query timeout in seconds.
         """
-        assembled = self._query_assembler.assemble(query)
-        raw_row = await self._connection.fetchrow(assembled.query, *assembled.args, timeout=timeout)
+        assembled = self._assemble(query)
+        raw_row = await self._fetchrow(assembled.query, *assembled.args, timeout=timeout)
         if raw_row is None:
             return None
-        return TypeParser.parse(type_, raw_row)
+        return _parse(type_, raw_row)
+
+    async def copy_records_to_table(
+        self,
+        table_name: str,
+        *,
+        records: Iterable[Sequence[object]],
+        columns: Sequence[str] | None = None,
+        schema_name: str | None = None,
+        timeout: float | None = None,
+    ) -> str:
+        """Bulk-load *records* into a table with ``COPY`` and return its status string.
+
+        The rows are sent with PostgreSQL's binary copy protocol, which is considerably faster than
+        inserting them one statement at a time. Table and column names are quoted as identifiers.
+
+        Args:
+            table_name: The name of the table to copy into.
+            records: The rows to copy, each a sequence of column values.
+            columns: The columns the values belong to. Defaults to all columns in table order.
+            schema_name: The schema of the table. Defaults to the search path.
+            timeout: Optional query timeout in seconds.
+        """
+        return await self._connection.copy_records_to_table(
+            table_name, records=records, columns=columns, schema_name=schema_name, timeout=timeout
+        )
 
     async def add_listener(self, channel: str, payload_type: type[T], callback: Listener[T]) -> None:
         """Subscribe to PostgreSQL LISTEN/NOTIFY notifications on *channel*.
@@ -231,28 +485,17 @@ class Connection(AbstractAsyncContextManager[Transaction]):
             callback: The listener to invoke on each notification.
         """
 
-        if iscoroutinefunction(callback):
-
-            async def async_listener(
-                con_ref: AsyncpgConnection | PoolConnectionProxy, pid: int, channel: str, payload: object, /
-            ) -> None:
-                parsed_payload = TypeParser.parse(payload_type, payload)
-
-                await callback(Connection(con_ref, self._query_assembler), pid, channel, parsed_payload)
-
-            await self._connection.add_listener(channel, async_listener)
-            self._listener_mapping[(callback, channel)] = async_listener
-
+        con_ref, query_assembler = self._connection, self._query_assembler
+        inner_listener: _InnerListener
+        if _is_async(callback):
+            # asyncpg detects coroutine listeners with inspect.iscoroutinefunction, which does not
+            # look at __call__ of instances, so the bound method is registered instead of the adapter
+            inner_listener = _AsyncListenerAdapter(payload_type, callback, self, con_ref, query_assembler).__call__
         else:
+            inner_listener = _SyncListenerAdapter(payload_type, callback, self, con_ref, query_assembler)
 
-            def sync_listener(
-                con_ref: AsyncpgConnection | PoolConnectionProxy, pid: int, channel: str, payload: object, /
-            ) -> None:
-                parsed_payload = TypeParser.parse(payload_type, payload)
-                callback(Connection(con_ref, self._query_assembler), pid, channel, parsed_payload)
-
-            await self._connection.add_listener(channel, sync_listener)
-            self._listener_mapping[(callback, channel)] = sync_listener
+        await con_ref.add_listener(channel, inner_listener)
+        self._listener_mapping[(callback, channel)] = inner_listener
 
     async def remove_listener(self, channel: str, callback: Listener[T]) -> None:
         """Unsubscribe a previously registered listener from *channel*.
@@ -264,28 +507,26 @@ class Connection(AbstractAsyncContextManager[Transaction]):
         inner_listener = self._listener_mapping.pop((callback, channel))
         await self._connection.remove_listener(channel, inner_listener)
 
-    @override
     async def __aenter__(self) -> Transaction:
         transaction = self._connection.transaction()
         await transaction.start()
-        self._transaction = Transaction(self, transaction)
-        return self._transaction
+        # asyncpg nests a transaction started inside an open block as a savepoint
+        wrapper = Transaction(self, transaction)
+        self._transactions.append(wrapper)
+        return wrapper
 
-    @override
     async def __aexit__(
         self,
         exc_type: type[BaseException] | None,
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        if self._transaction is None:
-            raise RuntimeError("Transaction is not initialized")  # pragma: no cover
-
+        transaction = self._transactions.pop()
         if exc_val is None:
-            if self._transaction.status == TransactionStatus.MARKED_FOR_ROLLBACK:
-                await self._transaction.rollback()
+            if transaction.status is TransactionStatus.MARKED_FOR_ROLLBACK:
+                await transaction.rollback()
             else:
-                await self._transaction.commit()
+                await transaction.commit()
         else:
-            await self._transaction.rollback()
-            raise exc_val
+            # returning without suppressing lets the interpreter re-raise the original exception
+            await transaction.rollback()
@@ -1,27 +1,50 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Generator
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Generator
 from typing import Self, override
 
+from asyncpg import Record
 from asyncpg.cursor import (
     Cursor as AsyncpgCursor,
     CursorFactory as AsyncpgCursorFactory,
     CursorIterator as AsyncpgCursorIterator,
 )
+from pydantic import TypeAdapter
 
-from fassung.type_parser import TypeParser
+from fassung.type_parser import PASSTHROUGH_TYPES, TypeParser
+
+# Rows fetched per round trip when iterating a cursor. Larger pages mean fewer round trips on big
+# scans, at the cost of holding up to this many parsed rows in memory at once.
+DEFAULT_CURSOR_PREFETCH = 10000
+
+
+def _list_adapter[T](type_: type[T]) -> TypeAdapter[list[T]] | None:
+    # resolved once per cursor so each page is validated without a cache lookup; None for rows kept raw
+    if type_ in PASSTHROUGH_TYPES:
+        return None
+    return TypeParser.list_adapter(type_)
 
 
 class CursorIterator[T](AsyncIterator[T]):
     """Async iterator that yields typed rows from a query result.
 
+    Rows are fetched in pages of *prefetch* rows and each page is parsed with a single
+    validation call. Paging is left to asyncpg's cursor iterator, which binds the portal and
+    fetches the first page in one round trip and closes the portal once it is exhausted.
+
     Not intended to be created directly — use [fassung.cursor.CursorFactory][] in an
     ``async for`` loop instead.
     """
 
-    def __init__(self, cursor: AsyncpgCursorIterator, type_: type[T]) -> None:
-        self._iterator: AsyncpgCursorIterator = cursor
-        self._type: type[T] = type_
+    __slots__ = ("_buffer", "_exhausted", "_index", "_iterator", "_list_adapter", "_prefetch")
+
+    def __init__(self, iterator: AsyncpgCursorIterator, type_: type[T], prefetch: int) -> None:
+        self._iterator: AsyncpgCursorIterator = iterator
+        self._list_adapter: TypeAdapter[list[T]] | None = _list_adapter(type_)
+        self._prefetch: int = prefetch
+        self._buffer: list[T] = []
+        self._index: int = 0
+        self._exhausted: bool = False
 
     @override
     def __aiter__(self) -> Self:
@@ -29,8 +52,33 @@ class CursorIterator[T](AsyncIterator[T]):
 
     @override
     async def __anext__(self) -> T:
-        raw_record = await self._iterator.__anext__()
-        return TypeParser.parse(self._type, raw_record)
+        if self._index == len(self._buffer):
+            await self._fetch_page()
+        row = self._buffer[self._index]
+        self._index += 1
+        return row
+
+    async def _fetch_page(self) -> None:
+        if self._exhausted:
+            raise StopAsyncIteration
+        # asyncpg fetches *prefetch* rows at once, so only the first row of a page waits for the
+        # server and the rest are taken from its buffer
+        next_record = self._iterator.__anext__
+        raw_list: list[Record] = []
+        append = raw_list.append
+        try:
+            for _ in range(self._prefetch):
+                append(await next_record())
+        except StopAsyncIteration:
+            self._exhausted = True
+        if not raw_list:
+            raise StopAsyncIteration
+        list_adapter = self._list_adapter
+        if list_adapter is None:
+            self._buffer = raw_list  # pyright: ignore[reportAttributeAccessIssue]
+        else:
+            self._buffer = TypeParser.validate_list(list_adapter, raw_list)
+        self._index = 0
 
 
 class Cursor[T]:
@@ -39,9 +87,15 @@ class Cursor[T]:
     Not intended to be created directly — await a [fassung.cursor.CursorFactory][] instead.
     """
 
+    __slots__ = ("_cursor", "_list_adapter", "_validate")
+
     def __init__(self, cursor: AsyncpgCursor, type_: type[T]) -> None:
         self._cursor: AsyncpgCursor = cursor
-        self._type: type[T] = type_
+        # the row validator is bound once, so fetchrow calls it without going through the adapter
+        self._validate: Callable[..., T] | None = (
+            None if type_ in PASSTHROUGH_TYPES else TypeParser.adapter(type_).validate_python
+        )
+        self._list_adapter: TypeAdapter[list[T]] | None = _list_adapter(type_)
 
     async def fetch(self, n: int, *, timeout: float | None = None) -> list[T]:
         """Fetch the next *n* rows and return them as a typed list.
@@ -51,7 +105,10 @@ class Cursor[T]:
             timeout: Optional query timeout in seconds.
         """
         raw_list = await self._cursor.fetch(n, timeout=timeout)
-        return TypeParser.parse(list[self._type], raw_list)
+        list_adapter = self._list_adapter
+        if list_adapter is None:
+            return raw_list  # pyright: ignore[reportReturnType]
+        return TypeParser.validate_list(list_adapter, raw_list)
 
     async def fetchrow(self, *, timeout: float | None = None) -> T | None:
         """Fetch the next row, or return ``None`` if exhausted.
@@ -60,9 +117,29 @@ class Cursor[T]:
             timeout: Optional query timeout in seconds.
         """
         raw_record = await self._cursor.fetchrow(timeout=timeout)
-        if not raw_record:
+        if raw_record is None:
             return None
-        return TypeParser.parse(self._type, raw_record)
+        validate = self._validate
+        if validate is None:
+            return raw_record  # pyright: ignore[reportReturnType]
+        return validate(raw_record, by_alias=True)
+
+    async def iter_batches(self, n: int, *, timeout: float | None = None) -> AsyncIterator[list[T]]:
+        """Yield the remaining rows as typed lists of up to *n* rows.
+
+        Each batch costs one round trip and one validation call, which makes this the preferred
+        way to stream large results that are processed in chunks anyway.
+
+        Args:
+            n: Maximum number of rows per batch.
+            timeout: Optional query timeout in seconds.
+        """
+        while True:
+            rows = await self.fetch(n, timeout=timeout)
+            if rows:
+                yield rows
+            if len(rows) < n:
+                return
 
     async def forward(self, n: int, *, timeout: float | None = None) -> int:
         """Skip forward *n* rows and return the number of rows actually skipped.
@@ -82,16 +159,26 @@ class CursorFactory[T](Awaitable[Cursor[T]], AsyncIterable[T]):
     [fassung.connection.Transaction.cursor][].
     """
 
-    def __init__(self, cursor_factory: AsyncpgCursorFactory, type_: type[T]) -> None:
-        self._cursor_factory: AsyncpgCursorFactory = cursor_factory
+    __slots__ = ("_open_cursor", "_prefetch", "_type")
+
+    def __init__(
+        self,
+        open_cursor: Callable[..., AsyncpgCursorFactory],
+        type_: type[T],
+        prefetch: int | None = DEFAULT_CURSOR_PREFETCH,
+    ) -> None:
+        # asyncpg only accepts a prefetch for cursors that are iterated, so its cursor factory is
+        # created on use, with the prefetch for iteration and without it when awaited
+        self._open_cursor: Callable[..., AsyncpgCursorFactory] = open_cursor
         self._type: type[T] = type_
+        self._prefetch: int = DEFAULT_CURSOR_PREFETCH if prefetch is None else prefetch
 
     @override
     def __aiter__(self) -> CursorIterator[T]:
-        iterator = self._cursor_factory.__aiter__()
-        return CursorIterator(iterator, self._type)
+        iterator = aiter(self._open_cursor(prefetch=self._prefetch))
+        return CursorIterator(iterator, self._type, self._prefetch)
 
     @override
     def __await__(self) -> Generator[None, None, Cursor[T]]:
-        cursor = yield from self._cursor_factory.__await__()
+        cursor = yield from self._open_cursor().__await__()
         return Cursor(cursor, self._type)
@@ -3,4 +3,4 @@ class TransactionClosedError(Exception):
 
 
 class UnsupportedTemplateError(Exception):
-    """Raised when a plain string is passed where a Template is required."""
+    """Raised when a query that is not a Template, such as a plain string, is passed."""
@@ -1,17 +1,49 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from types import TracebackType
 from typing import cast
 
 from asyncpg import create_pool
-from asyncpg.pool import Pool as AsyncpgPool
+from asyncpg.pool import Pool as AsyncpgPool, PoolConnectionProxy
 
-from fassung import Connection
+from fassung.connection import Connection
 from fassung.query_assembler import QueryAssembler
 from fassung.record import MappedRecord
 
 
+class Context:
+    """
+    Async context manager that checks a connection out of a [fassung.pool.Pool][] for the
+    duration of an ``async with`` block.
+
+    Not intended to be created directly — use [fassung.pool.Pool.acquire][] instead.
+    """
+
+    __slots__ = ("_pool", "_proxy", "_query_assembler")
+
+    def __init__(self, pool: AsyncpgPool, query_assembler: QueryAssembler) -> None:
+        self._pool: AsyncpgPool = pool
+        self._query_assembler: QueryAssembler = query_assembler
+        self._proxy: PoolConnectionProxy
+
+    async def __aenter__(self) -> Connection:
+        # the acquired proxy is kept here, so it is what gets released even if wrapping it fails
+        proxy = self._proxy = await self._pool.acquire()
+        try:
+            return Connection(proxy, self._query_assembler)
+        except BaseException:
+            await self._pool.release(proxy)
+            raise
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self._pool.release(self._proxy)
+
+
 class Pool:
     """
     A connection pool for managing database connections.
@@ -23,30 +55,35 @@ class Pool:
 
         Args:
             pool: The asyncpg pool to use.
-            query_assembler: The [fassung.query_assembler.QueryAssembler][] to use.
+            query_assembler: The [fassung.query_assembler.QueryAssembler][] to use. Defaults to a new
+                one per pool.
         """
         self._pool: AsyncpgPool = pool
         self.query_assembler: QueryAssembler = query_assembler or QueryAssembler()
 
-    @asynccontextmanager
-    async def acquire(self) -> AsyncGenerator[Connection]:
+    def acquire(self) -> Context:
         """
         Acquire a connection from the pool.
 
-        Yields:
-            A [fassung.connection.Connection][] to the database.
+        Returns:
+            A [fassung.pool.Context][] that yields a [fassung.connection.Connection][] to the database
+            and releases it back to the pool on exit.
         """
-        async with self._pool.acquire() as connection:
-            yield Connection(connection, self.query_assembler)
+        return Context(self._pool, self.query_assembler)
 
     @staticmethod
     async def from_connection_string(
         connection_string: str,
         *,
-        min_size: int = 10,
-        max_size: int = 10,
+        min_size: int = 4,
+        max_size: int = 20,
         max_queries: int = 50000,
         max_inactive_connection_lifetime: float = 300.0,
+        statement_cache_size: int = 100,
+        max_cached_statement_lifetime: int = 300,
+        max_cacheable_statement_size: int = 1024 * 15,
+        tcp_keepalives_idle: int | None = None,
+        tcp_keepalives_interval: int | None = None,
         host: str | None = None,
         port: int | None = None,
         user: str | None = None,
@@ -64,15 +101,31 @@ class Pool:
             max_size: The maximum number of connections in the pool.
             max_queries: The maximum number of queries to execute before closing a connection.
             max_inactive_connection_lifetime: The maximum time a connection can be inactive before being closed.
+            statement_cache_size: The number of prepared statements cached per connection. Repeated queries
+                reuse the cached statement instead of being parsed and planned again. Set to ``0`` to disable
+                the cache, e.g. behind a transaction-pooling pgbouncer or for queries prone to bad generic plans.
+            max_cached_statement_lifetime: The maximum time in seconds a prepared statement stays cached.
+                ``0`` keeps statements until they are evicted.
+            max_cacheable_statement_size: The maximum size in bytes of a query whose statement is cached.
+            tcp_keepalives_idle: Seconds of inactivity after which the server sends a TCP keepalive on its
+                side of the connection, so the server notices dead clients. Not sent unless set, since
+                poolers such as pgbouncer reject unknown startup parameters.
+            tcp_keepalives_interval: Seconds between unanswered server-side TCP keepalives before the server
+                drops the connection. Not sent unless set.
             host: The host to connect to.
             port: The port to connect to.
             user: The user to connect as.
             password: The password to use for authentication.
             passfile: The path to the password file.
             database: The database to connect to.
-            query_assembler: The [fassung.query_assembler.QueryAssembler][] to use.
+            query_assembler: The [fassung.query_assembler.QueryAssembler][] to use. Defaults to a new
+                one per pool.
         """
-        query_assembler = query_assembler or QueryAssembler()
+        server_settings: dict[str, str] = {}
+        if tcp_keepalives_idle is not None:
+            server_settings["tcp_keepalives_idle"] = str(tcp_keepalives_idle)
+        if tcp_keepalives_interval is not None:
+            server_settings["tcp_keepalives_interval"] = str(tcp_keepalives_interval)
         asyncpg_pool = cast(
             AsyncpgPool,
             await create_pool(
@@ -81,12 +134,16 @@ class Pool:
                 max_size=max_size,
                 max_queries=max_queries,
                 max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+                statement_cache_size=statement_cache_size,
+                max_cached_statement_lifetime=max_cached_statement_lifetime,
+                max_cacheable_statement_size=max_cacheable_statement_size,
                 host=host,
                 port=port,
                 user=user,
                 password=password,
                 passfile=passfile,
                 database=database,
+                server_settings=server_settings or None,
                 record_class=MappedRecord,
             ),
         )
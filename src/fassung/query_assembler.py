@@ -1,9 +1,12 @@
-from itertools import zip_longest
+from collections import OrderedDict
 from string.templatelib import Template
 from typing import Any, NamedTuple
 
 from fassung.exceptions import UnsupportedTemplateError
 
+# preformatted $N placeholders for the common case; queries with more arguments format the rest
+_PLACEHOLDERS: tuple[str, ...] = tuple(f"${i}" for i in range(1, 257))
+
 
 class AssembledQuery(NamedTuple):
     """A parameterised query ready for asyncpg execution.
@@ -18,7 +21,23 @@ class AssembledQuery(NamedTuple):
 
 
 class QueryAssembler:
-    """Converts t-string templates into parameterised asyncpg queries."""
+    """Converts t-string templates into parameterised asyncpg queries.
+
+    Assembled SQL is cached by the static strings of a template, or for nested templates by
+    the strings of every template in the tree and where they are nested, so repeated
+    executions of the same t-string literals skip re-assembly.
+    """
+
+    def __init__(self, cache_size: int = 256) -> None:
+        """
+        Initialize a new query assembler.
+
+        Args:
+            cache_size: The number of assembled queries to keep, least recently used first out.
+                ``0`` disables the cache.
+        """
+        self._cache_size: int = cache_size
+        self._cache: OrderedDict[tuple[Any, ...], str] = OrderedDict()
 
     def assemble(self, query: Template) -> AssembledQuery:
         """Assemble a Template into an [fassung.query_assembler.AssembledQuery][].
@@ -27,39 +46,87 @@ class QueryAssembler:
             query: A t-string template containing SQL with interpolated values.
 
         Raises:
-            UnsupportedTemplateError: If *query* is a plain string.
+            UnsupportedTemplateError: If *query* is not a Template, e.g. a plain string.
         """
-        if isinstance(query, str):  # pyright: ignore[reportUnnecessaryIsInstance]
-            raise UnsupportedTemplateError("fassung does not support str as queries. Use Template query type instead.")  # pyright: ignore[reportUnreachable]
-        assembled_query, args = self._assemble_recursive(query)
-        if args:
-            return AssembledQuery(assembled_query, args)
-        return AssembledQuery(assembled_query, ())
+        if type(query) is not Template:  # Template cannot be subclassed, so this is exact
+            raise UnsupportedTemplateError(
+                f"fassung does not support {type(query).__name__} as queries. Use Template query type instead."
+            )
+        values = query.values
+        if not values:
+            # a template without interpolations consists of a single string
+            return AssembledQuery(query.strings[0], values)
+        if any(isinstance(value, Template) for value in values):
+            key, values = self._shape(query)
+        else:
+            key = query.strings
+        cached_query = self._cache.get(key)
+        if cached_query is not None:
+            self._cache.move_to_end(key)
+            return AssembledQuery(cached_query, values)
+
+        assembled_query, args = self._assemble_iterative(query)
+        self._cache[key] = assembled_query
+        if len(self._cache) > self._cache_size:
+            _ = self._cache.popitem(last=False)
+        return AssembledQuery(assembled_query, args)
 
     @staticmethod
-    def _assemble_recursive(query: Template, counter_start: int = 0) -> tuple[str, tuple[Any, ...]]:
+    def _shape(query: Template) -> tuple[tuple[Any, ...], tuple[Any, ...]]:
         """
-        Recursively assemble a template query into an asyncpg query + arguments
+        Collect the cache key and arguments of a nested template: the strings of every template
+        in pre-order, with None standing in for each plain value, and the plain values in the
+        order the assembler numbers them
         """
-        placeholders: list[str] = []
-        values: list[Any] = []
-        counter = counter_start
-        for value in query.values:
-            if isinstance(value, Template):
-                parsed_sub_query, sub_query_values = QueryAssembler._assemble_recursive(value, counter)
-                if not parsed_sub_query.startswith(" "):  # add a space if necessary
-                    parsed_sub_query = " " + parsed_sub_query
-                placeholders.append(parsed_sub_query)
-                values.extend(sub_query_values)
-                counter += len(sub_query_values)
-            else:
-                placeholders.append(f"${counter + 1}")
-                values.append(value)
-                counter += 1
-
-        # interleave strings and new placeholders. The first item in this list is always a string
-        paired = zip_longest(query.strings, placeholders)
-        flattened_and_filtered = [item for pair in paired for item in pair if item is not None]
-        new_query = "".join(flattened_and_filtered)
-
-        return new_query, tuple(values)
+        key: list[tuple[str, ...] | None] = [query.strings]
+        args: list[Any] = []
+        stack: list[tuple[Template, int]] = [(query, 0)]
+        while stack:
+            template, index = stack.pop()
+            values = template.values
+            while index < len(values):
+                value = values[index]
+                index += 1
+                if isinstance(value, Template):
+                    key.append(value.strings)
+                    stack.append((template, index))
+                    stack.append((value, 0))
+                    break
+                key.append(None)
+                args.append(value)
+
+        return tuple(key), tuple(args)
+
+    @staticmethod
+    def _assemble_iterative(query: Template) -> tuple[str, tuple[Any, ...]]:
+        """
+        Assemble a template query into an asyncpg query + arguments, flattening nested templates
+        with an explicit stack instead of recursion
+        """
+        parts: list[str] = []
+        args: list[Any] = []
+        # a frame is a template and the index of its next string; string i is followed by value i
+        stack: list[tuple[Template, int]] = [(query, 0)]
+        while stack:
+            template, index = stack.pop()
+            strings = template.strings
+            values = template.values
+            while True:
+                if string := strings[index]:
+                    parts.append(string)
+                if index == len(values):
+                    break
+                value = values[index]
+                index += 1
+                if isinstance(value, Template):
+                    # add a space if necessary
+                    if parts and not parts[-1][-1].isspace() and not value.strings[0][:1].isspace():
+                        parts.append(" ")
+                    stack.append((template, index))
+                    stack.append((value, 0))
+                    break
+                position = len(args)
+                args.append(value)
+                parts.append(_PLACEHOLDERS[position] if position < 256 else f"${position + 1}")
+
+        return "".join(parts), tuple(args)
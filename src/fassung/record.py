@@ -1,15 +1,16 @@
 from collections.abc import Mapping
+from typing import Any
 
 from asyncpg import Record
 
 
-class MappedRecord(Record):
-    """An asyncpg Record subclass registered as a Mapping.
+# Record's keys/values/items return iterators rather than views, which pydantic does not mind
+class MappedRecord(Record, Mapping[str, Any]):  # pyright: ignore[reportIncompatibleMethodOverride]
+    """An asyncpg Record subclass that is a Mapping.
 
     This allows Pydantic to validate record instances directly, without
-    converting the base Record class itself into a Mapping.
+    converting the base Record class itself into a Mapping. Record comes first
+    in the MRO, so its C implementations of the mapping methods are used, and
+    ``isinstance`` checks against Mapping resolve through the MRO instead of
+    the ABC registry.
     """
-
-
-# register MappedRecord as a mapping so pydantic can parse it without making Record a Mapping
-Mapping.register(MappedRecord)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
@@ -3,17 +3,25 @@ from typing import Any, ClassVar, TypeVar
 from asyncpg import Record
 from pydantic import TypeAdapter
 
+from fassung.record import MappedRecord
+
 T = TypeVar("T")
 
+# Target types for which raw asyncpg values are returned as they are, without validation.
+PASSTHROUGH_TYPES: frozenset[object] = frozenset({Any, object, Record, MappedRecord})
+
 
 class TypeParser:
     """Validates and converts raw asyncpg values into typed Python objects via Pydantic.
 
     Type adapters are cached so repeated conversions to the same target type
-    skip adapter construction.
+    skip adapter construction. Values that already are exactly of the target type, and
+    targets in ``PASSTHROUGH_TYPES``, are returned without validation.
     """
 
     _type_adapters: ClassVar[dict[type, TypeAdapter[Any]]] = {}
+    # keyed by element type, so lookups hash the plain type instead of a list[...] alias
+    _list_type_adapters: ClassVar[dict[type, TypeAdapter[list[Any]]]] = {}
 
     @classmethod
     def parse(cls, type_: type[T], value: Record | list[Record] | Any) -> T:
@@ -23,6 +31,60 @@ class TypeParser:
             type_: The target type to validate against.
             value: A raw value, Record, or list of Records to convert.
         """
-        if type_ not in cls._type_adapters:
-            cls._type_adapters[type_] = TypeAdapter(type_)
-        return cls._type_adapters[type_].validate_python(value, by_alias=True)
+        if type(value) is type_ or type_ in PASSTHROUGH_TYPES:
+            return value  # pyright: ignore[reportReturnType]
+        return cls.adapter(type_).validate_python(value, by_alias=True)
+
+    @classmethod
+    def parse_list(cls, type_: type[T], value: list[Record] | Any) -> list[T]:
+        """Validate every element of *value* against *type_* and return the resulting list.
+
+        Args:
+            type_: The target type of each element.
+            value: A list of Records or raw values to convert.
+        """
+        if not value:
+            return []
+        if type_ in PASSTHROUGH_TYPES:
+            return value  # pyright: ignore[reportReturnType]
+        return cls.validate_list(cls.list_adapter(type_), value)
+
+    @classmethod
+    def validate_list(cls, adapter: TypeAdapter[list[T]], value: list[Record] | Any) -> list[T]:
+        """Validate *value* with a list adapter obtained from [fassung.type_parser.TypeParser.list_adapter][].
+
+        Args:
+            adapter: The list adapter to validate with.
+            value: A list of Records or raw values to convert.
+        """
+        if not value:
+            return []
+        return adapter.validate_python(value, by_alias=True)
+
+    @classmethod
+    def adapter(cls, type_: type[T]) -> TypeAdapter[T]:
+        """Return the cached type adapter for *type_*, creating it on first use.
+
+        Callers that validate many values against the same type can hold on to the adapter
+        instead of going through [fassung.type_parser.TypeParser.parse][] for each one.
+
+        Args:
+            type_: The target type to validate against.
+        """
+        adapter = cls._type_adapters.get(type_)
+        if adapter is None:
+            adapter = cls._type_adapters[type_] = TypeAdapter(type_)
+        return adapter
+
+    @classmethod
+    def list_adapter(cls, type_: type[T]) -> TypeAdapter[list[T]]:
+        """Return the cached type adapter for ``list[type_]``, creating it on first use.
+
+        Args:
+            type_: The target type of each element.
+        """
+        adapter = cls._list_type_adapters.get(type_)
+        if adapter is None:
+            list_type: type[list[T]] = list[type_]
+            adapter = cls._list_type_adapters[type_] = TypeAdapter(list_type)
+        return adapter
@@ -1,4 +1,5 @@
 from collections.abc import AsyncGenerator
+from datetime import UTC, date, datetime
 from os import environ
 
 import pytest
@@ -13,12 +14,55 @@ def connection_string() -> str:
 
 @pytest.fixture(scope="session")
 async def pool(connection_string: str) -> Pool:
-    return await Pool.from_connection_string(connection_string)
+    # a fixed number of warm connections keeps their statement caches alive across tests
+    return await Pool.from_connection_string(
+        connection_string, min_size=4, max_size=4, statement_cache_size=2048, max_cached_statement_lifetime=0
+    )
+
+
+_STUDENT_COLUMNS = (
+    "id",
+    "full_name",
+    "email",
+    "birth_date",
+    "major",
+    "gpa",
+    "is_active",
+    "enrolled_at",
+    "last_seen_at",
+)
+_STUDENT_RECORDS = [
+    (
+        1,
+        "Jane Doe",
+        "jane@example.edu",
+        date(2002, 5, 14),
+        "Physics",
+        3.9,
+        True,
+        datetime(2023, 9, 1, 9, 0, tzinfo=UTC),
+        datetime(2024, 2, 1, 10, 30, tzinfo=UTC),
+    ),
+    (
+        2,
+        "John Doe",
+        "john@example.edu",
+        date(2001, 11, 22),
+        "Mathematics",
+        2.8,
+        False,
+        datetime(2022, 1, 15, 14, 30, tzinfo=UTC),
+        None,
+    ),
+]
 
 
 async def _add_test_table_and_data(connection: Connection | Transaction) -> None:
+    # a query without values is sent as one simple query, so both DDL statements share a round trip;
+    # callers run this in a transaction that is rolled back, so the DROP never reaches a real table
     _ = await connection.execute(t"""
-    CREATE TABLE IF NOT EXISTS students (
+    DROP TABLE IF EXISTS students;
+    CREATE TABLE students (
         id INT PRIMARY KEY,
         full_name TEXT NOT NULL,
         email TEXT UNIQUE NOT NULL,
@@ -29,52 +73,8 @@ async def _add_test_table_and_data(connection: Connection | Transaction) -> None
         enrolled_at TIMESTAMPTZ NOT NULL,
         last_seen_at TIMESTAMPTZ
     );""")
-    _ = await connection.execute(
-        t"""INSERT INTO students (
-            id,
-            full_name,
-            email,
-            birth_date,
-            major,
-            gpa,
-            is_active,
-            enrolled_at,
-            last_seen_at
-        ) VALUES (
-            1,
-            'Jane Doe',
-            'jane@example.edu',
-            '2002-05-14',
-            'Physics',
-            3.9,
-            true,
-            '2023-09-01 09:00:00+00',
-            '2024-02-01 10:30:00+00'
-        );"""
-    )
-    _ = await connection.execute(
-        t"""INSERT INTO students (
-            id,
-            full_name,
-            email,
-            birth_date,
-            major,
-            gpa,
-            is_active,
-            enrolled_at,
-            last_seen_at
-        ) VALUES (
-            2,
-            'John Doe',
-            'john@example.edu',
-            '2001-11-22',
-            'Mathematics',
-            2.8,
-            false,
-            '2022-01-15 14:30:00+00',
-            NULL
-        );"""
-    )
+    # seeded with binary COPY, which stays cheap if the data set grows
+    _ = await connection.copy_records_to_table("students", records=_STUDENT_RECORDS, columns=_STUDENT_COLUMNS)
 
 
 @pytest.fixture
@@ -83,9 +83,18 @@ async def connection(pool: Pool) -> AsyncGenerator[Connection]:
         yield connection
 
 
-@pytest.fixture
-async def transaction(connection: Connection) -> AsyncGenerator[Transaction]:
-    async with connection as transaction:
+@pytest.fixture(scope="module")
+async def _outer_transaction(pool: Pool) -> AsyncGenerator[Transaction]:
+    # the table is created and seeded in one transaction per module and rolled back at the end,
+    # so nothing is ever committed; each test only pays for a savepoint
+    async with pool.acquire() as connection, connection as transaction:
         await _add_test_table_and_data(transaction)
         yield transaction
         transaction.mark_for_rollback()
+
+
+@pytest.fixture
+async def transaction(_outer_transaction: Transaction) -> AsyncGenerator[Transaction]:
+    async with _outer_transaction.savepoint() as transaction:
+        yield transaction
+        transaction.mark_for_rollback()
@@ -1,5 +1,7 @@
+from collections.abc import Sequence
 from datetime import UTC, date, datetime
 from string.templatelib import Template
+from typing import Any
 
 import pytest
 
@@ -7,6 +9,10 @@ from fassung import Transaction
 from tests.models import Student
 
 
+class _StudentWithTotal(Student):
+    total_count: int
+
+
 class StudentRepository:
     def __init__(self, transaction: Transaction) -> None:
         self._transaction: Transaction = transaction
@@ -61,7 +67,7 @@ class StudentRepository:
 
     async def fetch_all(
         self, limit: int | None = None, offset: int | None = None, where_clause: Template = t""
-    ) -> tuple[int, list[Student]]:
+    ) -> tuple[int, Sequence[Student]]:
 
         limit_query = t""
         if limit is not None:
@@ -71,12 +77,16 @@ class StudentRepository:
         if offset is not None:
             offset_query = t"OFFSET {offset}"
 
-        count_query = t"SELECT COUNT(*) FROM students {where_clause}"
-        count = await self._transaction.fetchval(int, count_query)
-
-        query = t"SELECT * FROM students {limit_query} {offset_query} {where_clause}"
-        students = await self._transaction.fetch(Student, query)
+        # the window count is computed before LIMIT/OFFSET, so rows and total arrive in one round trip
+        query = t"SELECT *, COUNT(*) OVER () AS total_count FROM students {where_clause} {limit_query} {offset_query}"
+        students = await self._transaction.fetch(_StudentWithTotal, query)
+        if students:
+            return students[0].total_count, students
+        if limit is None and offset is None:
+            return 0, students
 
+        # an empty page has no row to carry the total, so it is counted separately
+        count = await self._transaction.fetchval(int, t"SELECT COUNT(*) FROM students {where_clause}")
         return count, students
 
 
@@ -125,38 +135,23 @@ async def test_crud_fetch(crud: StudentRepository) -> None:
     assert student.id == 1
 
 
-async def test_crud_fetch_all(crud: StudentRepository) -> None:
-    count, students = await crud.fetch_all()
-    assert count == 2
-    assert len(students) == 2
-
-
-async def test_crud_fetch_all_with_limit(crud: StudentRepository) -> None:
-    count, students = await crud.fetch_all(limit=1)
-    assert count == 2
-    assert len(students) == 1
-
-
-async def test_crud_fetch_all_with_offset(crud: StudentRepository) -> None:
-    count, students = await crud.fetch_all(offset=1)
-    assert count == 2
-    assert len(students) == 1
-
-
-async def test_crud_fetch_all_with_limit_and_offset(crud: StudentRepository) -> None:
-    count, students = await crud.fetch_all(limit=1, offset=1)
-    assert count == 2
-    assert len(students) == 1
-
-
-async def test_crud_fetch_all_with_where_clause(crud: StudentRepository) -> None:
-    count, students = await crud.fetch_all(where_clause=t"WHERE id = 1")
-    assert count == 1
-    assert len(students) == 1
-
-
-async def test_crud_fetch_all_with_where_clause_date(crud: StudentRepository) -> None:
-    since = date(2002, 5, 14)
-    count, students = await crud.fetch_all(where_clause=t"WHERE birth_date = {since}")
-    assert count == 1
-    assert len(students) == 1
+@pytest.mark.parametrize(
+    ("kwargs", "expected_count", "expected_len"),
+    [
+        pytest.param({}, 2, 2, id="all"),
+        pytest.param({"limit": 1}, 2, 1, id="limit"),
+        pytest.param({"offset": 1}, 2, 1, id="offset"),
+        pytest.param({"limit": 1, "offset": 1}, 2, 1, id="limit_and_offset"),
+        pytest.param({"offset": 5}, 2, 0, id="offset_past_end"),
+        pytest.param({"limit": 0}, 2, 0, id="limit_zero"),
+        pytest.param({"where_clause": t"WHERE id = 999"}, 0, 0, id="no_match"),
+        pytest.param({"where_clause": t"WHERE id = 1"}, 1, 1, id="where_clause"),
+        pytest.param({"where_clause": t"WHERE birth_date = {date(2002, 5, 14)}"}, 1, 1, id="where_clause_date"),
+    ],
+)
+async def test_crud_fetch_all(
+    crud: StudentRepository, kwargs: dict[str, Any], expected_count: int, expected_len: int
+) -> None:
+    count, students = await crud.fetch_all(**kwargs)
+    assert count == expected_count
+    assert len(students) == expected_len
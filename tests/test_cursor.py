@@ -1,3 +1,5 @@
+import pytest
+
 from fassung import Transaction
 from tests.models import Student
 
@@ -23,6 +25,15 @@ async def test_cursor_iterator_is_iterable(transaction: Transaction) -> None:
     assert count == 2
 
 
+@pytest.mark.parametrize(
+    "prefetch", [1, 2, 3, None], ids=["smaller_than_result", "equal_to_result", "larger_than_result", "default"]
+)
+async def test_cursor_iterator_fetches_in_pages(transaction: Transaction, prefetch: int | None) -> None:
+    query = t"SELECT * FROM students ORDER BY id"
+    ids = [entry.id async for entry in transaction.cursor(Student, query, prefetch=prefetch)]
+    assert ids == [1, 2]
+
+
 async def test_cursor_fetch(transaction: Transaction) -> None:
     cursor = await transaction.cursor(Student, t"SELECT * FROM students")
     rows = await cursor.fetch(2)
@@ -49,6 +60,12 @@ async def test_cursor_fetchrow(transaction: Transaction) -> None:
     assert row is None
 
 
+async def test_cursor_iter_batches(transaction: Transaction) -> None:
+    cursor = await transaction.cursor(Student, t"SELECT * FROM students ORDER BY id")
+    batches = [[row.id for row in batch] async for batch in cursor.iter_batches(1)]
+    assert batches == [[1], [2]]
+
+
 async def test_cursor_forward(transaction: Transaction) -> None:
     cursor = await transaction.cursor(Student, t"SELECT * FROM students")
     skipped = await cursor.forward(1)
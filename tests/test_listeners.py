@@ -27,18 +27,40 @@ async def test_async_listener(connection: Connection) -> None:
         await connection.remove_listener("test_channel", on_notify)
 
 
+async def test_async_callable_listener(connection: Connection) -> None:
+    """Test that an object with an async __call__ is awaited like an async listener."""
+    received: list[str] = []
+    event = asyncio.Event()
+
+    class OnNotify:
+        async def __call__(self, con: Connection, pid: int, channel: str, payload: str) -> None:
+            received.append(payload)
+            event.set()
+
+    on_notify = OnNotify()
+    await connection.add_listener("callable_ch", str, on_notify)
+    try:
+        await connection.execute(t"NOTIFY callable_ch, 'called'")
+        await asyncio.wait_for(event.wait(), timeout=5.0)
+
+        assert received == ["called"]
+    finally:
+        await connection.remove_listener("callable_ch", on_notify)
+
+
 async def test_sync_listener(connection: Connection) -> None:
     """Test that a synchronous (non-async) listener also works."""
     received: list[str] = []
+    event = asyncio.Event()
 
     def on_notify_sync(con: Connection, pid: int, channel: str, payload: str) -> None:
         received.append(payload)
+        event.set()  # sync callbacks run on the event loop thread, so no call_soon_threadsafe is needed
 
     await connection.add_listener("sync_ch", str, on_notify_sync)
     try:
         await connection.execute(t"NOTIFY sync_ch, 'sync_msg'")
-        # Sync callbacks are invoked inline, but give a small window for delivery
-        await asyncio.sleep(0.5)
+        await asyncio.wait_for(event.wait(), timeout=5.0)
 
         assert received == ["sync_msg"]
     finally:
@@ -74,13 +96,23 @@ async def test_remove_listener(connection: Connection) -> None:
         nonlocal call_count
         call_count += 1
 
+    sentinel = asyncio.Event()
+
+    async def on_sentinel(con: Connection, pid: int, channel: str, payload: str) -> None:
+        sentinel.set()
+
     await connection.add_listener("remove_test", str, on_notify)
     await connection.remove_listener("remove_test", on_notify)
 
-    await connection.execute(t"NOTIFY remove_test, 'should_not_arrive'")
-    await asyncio.sleep(0.5)
+    await connection.add_listener("remove_test_sentinel", str, on_sentinel)
+    try:
+        # notifications are delivered in order, so once the sentinel arrives the first one would have too
+        await connection.execute(t"NOTIFY remove_test, 'should_not_arrive'; NOTIFY remove_test_sentinel, 'done'")
+        await asyncio.wait_for(sentinel.wait(), timeout=5.0)
 
-    assert call_count == 0
+        assert call_count == 0
+    finally:
+        await connection.remove_listener("remove_test_sentinel", on_sentinel)
 
 
 async def test_remove_unregistered_listener_raises(connection: Connection) -> None:
@@ -119,3 +151,23 @@ async def test_multiple_listeners_on_same_channel(connection: Connection) -> Non
     finally:
         await connection.remove_listener("multi_ch", listener_a)
         await connection.remove_listener("multi_ch", listener_b)
+
+
+async def test_listener_receives_registering_connection(connection: Connection) -> None:
+    """Test that the callback is handed the connection it was registered on."""
+    received: list[Connection] = []
+    event = asyncio.Event()
+
+    async def on_notify(con: Connection, pid: int, channel: str, payload: str) -> None:
+        received.append(con)
+        event.set()
+
+    await connection.add_listener("same_con_ch", str, on_notify)
+    try:
+        await connection.execute(t"NOTIFY same_con_ch, 'ping'")
+        await asyncio.wait_for(event.wait(), timeout=5.0)
+
+        assert received == [connection]
+        assert received[0] is connection
+    finally:
+        await connection.remove_listener("same_con_ch", on_notify)
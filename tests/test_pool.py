@@ -10,3 +10,14 @@ async def test_pool(connection_string: str) -> None:
         async with pool.acquire() as connection:
             assert connection
             assert isinstance(connection, Connection)
+
+
+async def test_pool_default_query_assembler(connection_string: str) -> None:
+    async with create_pool(connection_string) as asyncpg_pool:
+        pool = Pool(asyncpg_pool)
+        other = Pool(asyncpg_pool)
+        # each pool owns its assembler, so pools on different event loops never share a cache
+        assert isinstance(pool.query_assembler, QueryAssembler)
+        assert pool.query_assembler is not other.query_assembler
+        async with pool.acquire() as connection:
+            assert await connection.fetchval(int, t"SELECT {1}::int") == 1
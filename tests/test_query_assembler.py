@@ -156,3 +156,41 @@ async def test_query_assembler_unsupported_template_error() -> None:
     query = "SELECT * FROM table1"
     with pytest.raises(UnsupportedTemplateError):
         _ = query_assembler.assemble(query)  # pyright: ignore[reportArgumentType]
+
+
+async def test_query_assembler_reuses_cached_query() -> None:
+    query_assembler = QueryAssembler()
+    assembled = [query_assembler.assemble(t"SELECT * FROM table1 WHERE id = {var}") for var in (1, 2)]
+    assert assembled[0].query == "SELECT * FROM table1 WHERE id = $1"
+    assert assembled[0].args == (1,)
+    assert assembled[1].query == "SELECT * FROM table1 WHERE id = $1"
+    assert assembled[1].args == (2,)
+
+
+async def test_query_assembler_nested_query_spacing() -> None:
+    query_assembler = QueryAssembler()
+    var = 1
+    condition = t"field2 = {var}"
+    query = t"SELECT * FROM table1 WHERE field1 = {var} AND{condition} AND {condition}"
+    assembled = query_assembler.assemble(query)
+    assert assembled.query == "SELECT * FROM table1 WHERE field1 = $1 AND field2 = $2 AND field2 = $3"
+    assert assembled.args == (1, 1, 1)
+
+
+async def test_query_assembler_reuses_cached_nested_query() -> None:
+    query_assembler = QueryAssembler()
+    assembled = [
+        query_assembler.assemble(t"SELECT * FROM table1 WHERE id = {var} {t'AND field1 = {var * 2}'}")
+        for var in (1, 2)
+    ]
+    assert assembled[0].query == "SELECT * FROM table1 WHERE id = $1 AND field1 = $2"
+    assert assembled[0].args == (1, 2)
+    assert assembled[1].query == "SELECT * FROM table1 WHERE id = $1 AND field1 = $2"
+    assert assembled[1].args == (2, 4)
+
+
+async def test_query_assembler_without_cache() -> None:
+    query_assembler = QueryAssembler(cache_size=0)
+    assembled = [query_assembler.assemble(t"SELECT * FROM table1 WHERE id = {var}") for var in (1, 2)]
+    assert [a.query for a in assembled] == ["SELECT * FROM table1 WHERE id = $1"] * 2
+    assert [a.args for a in assembled] == [(1,), (2,)]
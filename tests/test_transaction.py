@@ -4,12 +4,18 @@ from string import Template
 
 import pytest
 from asyncpg import PostgresSyntaxError, UndefinedTableError
+from pydantic import BaseModel
 
 from fassung import Connection, Transaction, TransactionClosedError
 
 from .models import Student
 
 
+class _Row(BaseModel):
+    id: int
+    name: str
+
+
 async def test_execute(transaction: Transaction) -> None:
     result = await transaction.execute(t"UPDATE students SET gpa = 1 WHERE id = 1")
     assert result == "UPDATE 1"
@@ -51,15 +57,27 @@ async def test_fetchrow(transaction: Transaction) -> None:
     assert row_none is None
 
 
+async def test_copy_records_to_table(transaction: Transaction) -> None:
+    enrolled_at = datetime(2024, 9, 1, 9, 0, tzinfo=UTC)
+    records = [(3, "Jack Doe", "jack@example.edu", date(2003, 3, 3), "Chemistry", 3.1, True, enrolled_at)]
+    columns = ["id", "full_name", "email", "birth_date", "major", "gpa", "is_active", "enrolled_at"]
+    result = await transaction.copy_records_to_table("students", records=records, columns=columns)
+    assert result == "COPY 1"
+
+    row = await transaction.fetchrow(Student, t"SELECT * FROM students WHERE id = 3")
+    assert row is not None
+    assert row.full_name == "Jack Doe"
+    assert row.enrolled_at == enrolled_at
+
+
 @pytest.fixture
 async def connection_with_temporary_table(connection: Connection) -> AsyncGenerator[Connection]:
-    async with connection as transaction:
-        _ = await transaction.execute(t"CREATE TEMPORARY TABLE test_table (id INT, name TEXT)")
+    # DDL without values runs as a single simple query in its own implicit transaction
+    _ = await connection.execute(t"CREATE TEMPORARY TABLE test_table (id INT, name TEXT)")
     try:
         yield connection
     finally:
-        async with connection as transaction:
-            _ = await transaction.execute(t"DROP TABLE test_table")
+        _ = await connection.execute(t"DROP TABLE test_table")
 
 
 async def test_commit(connection_with_temporary_table: Connection) -> None:
@@ -72,6 +90,47 @@ async def test_commit(connection_with_temporary_table: Connection) -> None:
     assert val == name
 
 
+async def test_executemany(connection_with_temporary_table: Connection) -> None:
+    rows = [(1, "Walter"), (2, "Jesse")]
+    async with connection_with_temporary_table as transaction:
+        await transaction.executemany(
+            t"INSERT INTO test_table (id, name) VALUES ({row_id}, {name})" for row_id, name in rows
+        )
+
+    names = await connection_with_temporary_table.fetchval(
+        list[str], t"SELECT array_agg(name ORDER BY id) FROM test_table"
+    )
+    assert names == ["Walter", "Jesse"]
+
+
+async def test_specialize(connection_with_temporary_table: Connection) -> None:
+    async with connection_with_temporary_table as transaction:
+        _ = await transaction.execute(t"INSERT INTO test_table (id, name) VALUES (1, 'Walter'), (2, 'Jesse')")
+
+    row_id = 0
+    fetch_row = connection_with_temporary_table.specialize(_Row, t"SELECT * FROM test_table WHERE id = {row_id}")
+
+    first = await fetch_row(1)
+    second = await fetch_row(2)
+    missing = await fetch_row(999)
+
+    assert first == [_Row(id=1, name="Walter")]
+    assert second == [_Row(id=2, name="Jesse")]
+    assert missing == []
+
+
+async def test_specialize_checks_value_count(connection: Connection) -> None:
+    fetch_one = connection.specialize(int, t"SELECT {0}::int")
+    with pytest.raises(TypeError, match="has 1 placeholders but got 2 values"):
+        _ = await fetch_one(1, 2)
+
+
+async def test_executemany_requires_same_sql(transaction: Transaction) -> None:
+    queries = [t"UPDATE students SET gpa = {4.0} WHERE id = 1", t"UPDATE students SET major = {'Art'} WHERE id = 2"]
+    with pytest.raises(ValueError, match="same SQL"):
+        await transaction.executemany(queries)
+
+
 async def test_manual_rollback(connection_with_temporary_table: Connection) -> None:
     # Verify that manual rollback works
     async with connection_with_temporary_table as transaction:
@@ -103,8 +162,46 @@ async def test_rollback_on_error(connection: Connection) -> None:
         _ = await connection.execute(t"SELECT * FROM test_commit")
 
 
+async def test_savepoint(connection_with_temporary_table: Connection) -> None:
+    async with connection_with_temporary_table as transaction:
+        _ = await transaction.execute(t"INSERT INTO test_table (id, name) VALUES (1, 'Walter')")
+        async with transaction.savepoint() as savepoint:
+            _ = await savepoint.execute(t"INSERT INTO test_table (id, name) VALUES (2, 'Jesse')")
+            savepoint.mark_for_rollback()
+        async with transaction.savepoint() as savepoint:
+            _ = await savepoint.execute(t"INSERT INTO test_table (id, name) VALUES (3, 'Skyler')")
+
+        # the transaction stays usable after its savepoints and commits on exit
+        _ = await transaction.execute(t"INSERT INTO test_table (id, name) VALUES (4, 'Hank')")
+
+    ids = await connection_with_temporary_table.fetch(int, t"SELECT id FROM test_table ORDER BY id")
+    assert ids == [1, 3, 4]
+
+
+async def test_nested_block_after_mark_for_rollback(connection_with_temporary_table: Connection) -> None:
+    async with connection_with_temporary_table as transaction:
+        _ = await transaction.execute(t"INSERT INTO test_table (id, name) VALUES (1, 'Walter')")
+        transaction.mark_for_rollback()
+        async with connection_with_temporary_table as nested:
+            _ = await nested.execute(t"INSERT INTO test_table (id, name) VALUES (2, 'Jesse')")
+
+    # the outer block still rolls back everything, including its committed savepoint
+    count = await connection_with_temporary_table.fetchval(int, t"SELECT COUNT(*) FROM test_table")
+    assert count == 0
+
+
+async def test_closed_transaction_stays_closed(connection: Connection) -> None:
+    async with connection as transaction:
+        pass
+    async with connection:
+        with pytest.raises(TransactionClosedError):
+            _ = await transaction.execute(t"SELECT 1")
+
+
 @pytest.mark.parametrize(
-    ("where_query", "order_query", "expected_ids"), [(t"", t"ORDER BY id DESC", [2, 1]), (t"WHERE id = 1", t"", [1])]
+    ("where_query", "order_query", "expected_ids"),
+    [(t"", t"ORDER BY id DESC", [2, 1]), (t"WHERE id = 1", t"", [1])],
+    ids=["desc_all", "where_id_1"],
 )
 async def test_nested_fetch(
     transaction: Transaction, where_query: Template, order_query: Template, expected_ids: list[int]
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, TypeVar
 
 import pytest
@@ -26,6 +26,7 @@ class SomeModel(BaseModel):
         ("true", bool, True),
         ("1.1", float, 1.1),
         ("2026-01-25 21:07:05", datetime, datetime(2026, 1, 25, 21, 7, 5)),
+        ("2026-01-25T21:07:05.123456+00:00", datetime, datetime(2026, 1, 25, 21, 7, 5, 123456, tzinfo=UTC)),
         (
             {  # we cannot create MappedRecord instances, so we use a dict instead
                 "id": 1,
@@ -51,3 +52,25 @@ def test_parse_simple_type[T](value: Any, type_: type[T], expected: T) -> None:
     parsed = TypeParser.parse(type_, value)
     assert isinstance(parsed, type_)
     assert parsed == expected
+
+
+@pytest.mark.parametrize("type_", [Any, object])
+def test_parse_passthrough_type(type_: type[Any]) -> None:
+    value = {"id": 1}
+    assert TypeParser.parse(type_, value) is value
+
+
+def test_parse_exact_type_is_returned_unchanged() -> None:
+    value = datetime(2026, 1, 25, 21, 7, 5)
+    assert TypeParser.parse(datetime, value) is value
+
+
+def test_adapter_is_cached() -> None:
+    adapter = TypeParser.adapter(list[SomeModel])
+    assert TypeParser.adapter(list[SomeModel]) is adapter
+    assert adapter.validate_python([]) == []
+
+
+def test_parse_list() -> None:
+    assert TypeParser.parse_list(int, ["1", 2]) == [1, 2]
+    assert TypeParser.list_adapter(int) is TypeParser.list_adapter(int)